@@ -7,7 +7,7 @@ update policy as the production Event Grid pipeline for full parity (FR-034).
 
 Usage:
     python adx_runbook.py setup    --cluster <URI> --database <DB>
-    python adx_runbook.py ingest-local  --cluster <URI> --ingest-uri <URI> --database <DB> --file <PATH>
+    python adx_runbook.py ingest-local  --cluster <URI> --ingest-uri <URI> --database <DB> --file <PATH> [<PATH> ...]
     python adx_runbook.py ingest-blob   --cluster <URI> --ingest-uri <URI> --database <DB> --blob-uri <URI>
     python adx_runbook.py verify   --cluster <URI> --database <DB>
 
@@ -20,10 +20,24 @@ Auth methods (--auth-method):
 from __future__ import annotations
 
 import argparse
+import glob
+import gzip
+import hashlib
+import io
+import json
 import os
+import random
+import re
+import shutil
 import sys
+import tempfile
+import threading
 import time
+import uuid
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING, Final
 
 # ---------------------------------------------------------------------------
 # SSL fix: uv-managed Python may ship without CA certs. If SSL_CERT_FILE is
@@ -36,28 +50,91 @@ if not os.environ.get("SSL_CERT_FILE"):
     except ImportError:
         pass  # certifi not installed — rely on system certs
 
-from azure.identity import (
-    DefaultAzureCredential,
-    InteractiveBrowserCredential,
-    ManagedIdentityCredential,
-    ClientSecretCredential,
-)
-from azure.kusto.data import KustoClient, KustoConnectionStringBuilder
-from azure.kusto.data.data_format import DataFormat
-from azure.kusto.data.exceptions import KustoServiceError
-from azure.kusto.ingest import (
-    QueuedIngestClient,
-    IngestionProperties,
-    FileDescriptor,
-    BlobDescriptor,
-)
+# Azure SDK modules are imported inside the functions that use them, so that
+# `--help` and argument errors don't pay for loading azure-identity/-kusto.
+if TYPE_CHECKING:
+    from azure.core.credentials import TokenCredential
+    from azure.kusto.data import KustoClient, KustoConnectionStringBuilder
+    from azure.kusto.data.data_format import DataFormat
+    from azure.kusto.data.response import KustoResponseDataSet
+    from azure.kusto.ingest import IngestionProperties, KustoStreamingIngestClient, QueuedIngestClient
 
 # ---------------------------------------------------------------------------
 # KQL Schema Commands — identical to kql/schema/*.kql (FR-034)
 # ---------------------------------------------------------------------------
 
+# Ingestion batching profiles for --ingest-latency:
+#   (MaximumBatchingTimeSpan, MaximumNumberOfItems, MaximumRawDataSizeMB, label)
+# "balanced" matches kql/schema/policies.kql; "low" uses the documented 10 s /
+# 100 MB minimums; "minimum" also seals a batch per item (--profile dev default);
+# "throughput" lets size/count triggers fire before the timer.
+_BATCHING_PROFILES: Final[dict[str, tuple[str, int, int, str]]] = {
+    "minimum": ("00:00:10", 1, 100, "10 sec, 1 item"),
+    "low": ("00:00:10", 500, 100, "10 sec"),
+    "balanced": ("00:01:00", 20, 256, "1 min"),
+    "throughput": ("00:05:00", 1000, 1024, "5 min"),
+}
+
+
+def _batching_policy_command(profile: str) -> tuple[str, str]:
+    """Return the (description, command) pair for a staging-table batching profile."""
+    timespan, max_items, max_size_mb, label = _BATCHING_PROFILES[profile]
+    return (
+        f"Set ingestion batching policy ({label})",
+        f"""\
+.alter table FileTransferEvents_Raw policy ingestionbatching
+@'{{"MaximumBatchingTimeSpan": "{timespan}", "MaximumNumberOfItems": {max_items}, "MaximumRawDataSizeMB": {max_size_mb}}}'""",
+    )
+
+
+def _streaming_policy_commands(database: str) -> tuple[tuple[str, str], ...]:
+    """Return the commands enabling streaming ingestion for a dev database and the staging table."""
+    return (
+        (
+            f"Enable streaming ingestion on database ['{database}']",
+            f".alter database ['{database}'] policy streamingingestion enable",
+        ),
+        (
+            "Enable streaming ingestion on staging table",
+            ".alter table FileTransferEvents_Raw policy streamingingestion enable",
+        ),
+    )
+
+
+# DailySummary age aggregates. The tdigest sketch backs the P95 age panels
+# (percentile_tdigest(AgeDigest, 95)) and matches kql/schema/materialized-views.kql;
+# --age-buckets swaps it for fixed-threshold counters whose 8-byte state is far
+# cheaper to merge on each incremental refresh.
+_AGE_DIGEST_AGGREGATE = """\
+        AgeDigest       = tdigest(AgeMinutes)"""
+_AGE_BUCKET_AGGREGATES = """\
+        AgeUpTo5Min     = countif(AgeMinutes <= 5),
+        AgeUpTo30Min    = countif(AgeMinutes <= 30),
+        AgeUpTo120Min   = countif(AgeMinutes <= 120)"""
+
+
+def _daily_summary_command(age_buckets: bool) -> tuple[str, str]:
+    """Return the (description, command) pair creating the DailySummary materialized view."""
+    age_aggregates = _AGE_BUCKET_AGGREGATES if age_buckets else _AGE_DIGEST_AGGREGATE
+    return (
+        "Create DailySummary materialized view" + (" (age buckets)" if age_buckets else ""),
+        f"""\
+.create ifnotexists materialized-view DailySummary on table FileTransferEvents {{
+    FileTransferEvents
+    | summarize
+        TotalCount      = count(),
+        OkCount         = countif(Status == "OK"),
+        MissingCount    = countif(Status == "MISSING"),
+        DelayedCount    = countif(Status == "DELAYED"),
+        AvgAgeMinutes   = avg(AgeMinutes),
+{age_aggregates}
+    by Date = startofday(Timestamp)
+}}""",
+    )
+
+
 # DDL Execution Order per data-model.md
-SCHEMA_COMMANDS: list[tuple[str, str]] = [
+SCHEMA_COMMANDS: Final[tuple[tuple[str, str], ...]] = (
     # Step 1: Target table
     (
         "Create target table (FileTransferEvents)",
@@ -172,29 +249,10 @@ SCHEMA_COMMANDS: list[tuple[str, str]] = [
 .alter table FileTransferEvents_Errors policy retention
 @'{"SoftDeletePeriod": "30.00:00:00", "Recoverability": "Disabled"}'""",
     ),
-    # Step 11: Ingestion batching (1 minute)
-    (
-        "Set ingestion batching policy (1 min)",
-        """\
-.alter table FileTransferEvents_Raw policy ingestionbatching
-@'{"MaximumBatchingTimeSpan": "00:01:00", "MaximumNumberOfItems": 20, "MaximumRawDataSizeMB": 256}'""",
-    ),
-    # Step 12: Materialized view
-    (
-        "Create DailySummary materialized view",
-        """\
-.create ifnotexists materialized-view DailySummary on table FileTransferEvents {
-    FileTransferEvents
-    | summarize
-        TotalCount      = count(),
-        OkCount         = countif(Status == "OK"),
-        MissingCount    = countif(Status == "MISSING"),
-        DelayedCount    = countif(Status == "DELAYED"),
-        AvgAgeMinutes   = avg(AgeMinutes),
-        AgeDigest       = tdigest(AgeMinutes)
-    by Date = startofday(Timestamp)
-}""",
-    ),
+    # Step 11: Ingestion batching (1 minute; see --ingest-latency)
+    _batching_policy_command("balanced"),
+    # Step 12: Materialized view (tdigest age sketch; see --age-buckets)
+    _daily_summary_command(age_buckets=False),
     # Step 13: Materialized view retention (730 days)
     (
         "Set DailySummary retention (730 days)",
@@ -202,15 +260,75 @@ SCHEMA_COMMANDS: list[tuple[str, str]] = [
 .alter materialized-view DailySummary policy retention
 @'{"SoftDeletePeriod": "730.00:00:00", "Recoverability": "Enabled"}'""",
     ),
-]
+)
+
+# Streaming ingestion accepts at most 4 MB of uncompressed data per request
+_STREAMING_MAX_BYTES = 4 * 1024 * 1024
+
+# Files with these suffixes are uploaded as is (the SDK treats them as compressed);
+# the format comes from the suffix before them, e.g. events.csv.gz
+_COMPRESSED_SUFFIXES: Final = (".gz", ".zip")
+
+# File extension (without the dot) -> ingestion format when --format is not given
+_EXT_TO_FMT: Final[dict[str, str]] = {"csv": "csv", "json": "json", "jsonl": "json"}
+
+# Schema command name: text up to the first body token; ['quoted'] identifiers stay whole
+_COMMAND_NAME_RE = re.compile(r"(?:\['[^']*'\]|[^({@'\n])*")
 
-VERIFY_QUERY = """\
-FileTransferEvents
+# Dry-run lint: every schema command must be one of these control commands
+_CONTROL_COMMAND_RE = re.compile(r"^\.(?:create-merge|create-or-alter|create|alter)\s")
+# ...and a trailing '...' / @'...' literal holding a policy or mapping must be valid JSON
+_JSON_LITERAL_RE = re.compile(r"@?'(\[.*\]|\{.*\})'\s*$", re.DOTALL)
+
+# Table recording the SHA-256 of each successfully applied schema command, so
+# re-running setup skips commands that have not changed since the last run
+_SETUP_META_TABLE = "__ADXRunbookMeta"
+
+# Worker count for parallel setup — schema commands are network-bound round-trips
+_SETUP_MAX_WORKERS = 6
+
+# Worker count for multi-file ingest-local — each file is a network-bound upload
+_INGEST_MAX_WORKERS = 8
+
+# Verify output layout: cells right-aligned to _COL_W characters, joined by _SEP
+_COL_W = 20
+_SEP = " | "
+
+# Columns shown by `verify`, in display order
+_VERIFY_COLUMNS = (
+    "Filename", "SourcePresent", "TargetPresent",
+    "SourceLastModifiedUtc", "TargetLastModifiedUtc",
+    "AgeMinutes", "Status", "Notes", "Timestamp",
+)
+
+# Returns two result sets over the same 20 latest rows: the rows, each packed
+# server-side into one ready-to-print Row string of right-aligned cells, and a
+# one-row summary (null Timestamp count and status distribution).
+VERIFY_QUERY = f"""\
+let pad = (value: string) {{
+    iff(strlen(value) >= {_COL_W}, value, substring(strcat("{' ' * _COL_W}", value), strlen(value)))
+}};
+let recent = materialize(
+    FileTransferEvents
+    | order by Timestamp desc
+    | take 20
+);
+recent
 | order by Timestamp desc
-| take 20
-| project Filename, SourcePresent, TargetPresent,
-          SourceLastModifiedUtc, TargetLastModifiedUtc,
-          AgeMinutes, Status, Notes, Timestamp
+| project Row = strcat_array(pack_array(
+    pad(Filename),
+    pad(tostring(SourcePresent)),
+    pad(tostring(TargetPresent)),
+    pad(tostring(SourceLastModifiedUtc)),
+    pad(tostring(TargetLastModifiedUtc)),
+    pad(tostring(AgeMinutes)),
+    pad(Status),
+    pad(Notes),
+    pad(tostring(Timestamp))
+), "{_SEP}");
+recent
+| summarize NullTimestamps = countif(isnull(Timestamp)), Count = count() by Status
+| summarize NullTimestamps = sum(NullTimestamps), ByStatus = make_bag(bag_pack(Status, Count))
 """
 
 
@@ -218,26 +336,62 @@ FileTransferEvents
 # Authentication helpers
 # ---------------------------------------------------------------------------
 
+# Credentials and connection builders are cached for the life of the process so
+# every client shares one credential — and therefore one in-memory token cache.
+_CREDENTIAL_CACHE: dict[tuple[str, str | None, str | None], TokenCredential] = {}
+_KCSB_CACHE: dict[tuple[str, str, str | None, str | None], KustoConnectionStringBuilder] = {}
+
+
 def _build_kcsb(cluster_uri: str, args: argparse.Namespace) -> KustoConnectionStringBuilder:
-    """Build a KustoConnectionStringBuilder based on the chosen auth method."""
+    """Build a KustoConnectionStringBuilder based on the chosen auth method.
+
+    Builders are cached per (cluster, auth method, client, tenant), so repeated
+    calls in one run reuse the same credential instead of fetching a new token.
+    """
     auth = args.auth_method
+    client_id = args.client_id or os.environ.get("AZURE_CLIENT_ID")
+    client_secret = args.client_secret or os.environ.get("AZURE_CLIENT_SECRET")
+    tenant_id = args.tenant_id or os.environ.get("AZURE_TENANT_ID")
+
+    key = (cluster_uri, auth, client_id, tenant_id)
+    kcsb = _KCSB_CACHE.get(key)
+    if kcsb is None:
+        from azure.kusto.data import KustoConnectionStringBuilder
+
+        credential = _get_credential(auth, client_id, client_secret, tenant_id)
+        kcsb = KustoConnectionStringBuilder.with_azure_token_credential(cluster_uri, credential)
+        _KCSB_CACHE[key] = kcsb
+    return kcsb
+
+
+def _get_credential(
+    auth: str, client_id: str | None, client_secret: str | None, tenant_id: str | None
+) -> TokenCredential:
+    """Return the cached token credential for an auth method, creating it once."""
+    key = (auth, client_id, tenant_id)
+    credential = _CREDENTIAL_CACHE.get(key)
+    if credential is not None:
+        return credential
+
     if auth == "az-cli":
-        # Uses the token from `az login` — works in WSL, SSH, containers
-        credential = DefaultAzureCredential(
-            exclude_interactive_browser_credential=True,
-            exclude_shared_token_cache_credential=True,
-        )
-        return KustoConnectionStringBuilder.with_azure_token_credential(cluster_uri, credential)
+        from azure.identity import AzureCliCredential
+
+        # Uses the token from `az login` — works in WSL, SSH, containers. Used
+        # directly rather than via DefaultAzureCredential, which would first
+        # probe environment, workload and managed identity (IMDS can hang ~1s+).
+        credential = AzureCliCredential()
     elif auth == "interactive":
-        return KustoConnectionStringBuilder.with_interactive_login(cluster_uri)
+        from azure.identity import InteractiveBrowserCredential
+
+        # Opens a browser once per run; the cached credential serves every later token
+        credential = InteractiveBrowserCredential()
     elif auth == "managed-identity":
-        return KustoConnectionStringBuilder.with_aad_managed_service_identity_authentication(
-            cluster_uri
-        )
+        from azure.identity import ManagedIdentityCredential
+
+        credential = ManagedIdentityCredential()
     elif auth == "service-principal":
-        client_id = args.client_id or os.environ.get("AZURE_CLIENT_ID")
-        client_secret = args.client_secret or os.environ.get("AZURE_CLIENT_SECRET")
-        tenant_id = args.tenant_id or os.environ.get("AZURE_TENANT_ID")
+        from azure.identity import ClientSecretCredential
+
         if not all([client_id, client_secret, tenant_id]):
             print(
                 "ERROR: --client-id, --client-secret, and --tenant-id are required "
@@ -246,117 +400,609 @@ def _build_kcsb(cluster_uri: str, args: argparse.Namespace) -> KustoConnectionSt
                 file=sys.stderr,
             )
             sys.exit(1)
-        return KustoConnectionStringBuilder.with_aad_application_key_authentication(
-            cluster_uri, client_id, client_secret, tenant_id
-        )
+        credential = ClientSecretCredential(tenant_id, client_id, client_secret)
     else:
         print(f"ERROR: Unknown auth method: {auth}", file=sys.stderr)
         sys.exit(1)
 
+    _CREDENTIAL_CACHE[key] = credential
+    return credential
+
 
 # ---------------------------------------------------------------------------
 # Retry helper
 # ---------------------------------------------------------------------------
 
-_MAX_RETRIES = 3
-_RETRY_DELAY_SECONDS = 5
+_MAX_RETRIES = 5
+_RETRY_BASE_DELAY_SECONDS = 0.5
+_RETRY_MAX_DELAY_SECONDS = 30
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Error-message classifiers, compiled once and matched case-insensitively so
+# (potentially large) Kusto error payloads aren't lower-cased on every check
+_EXISTS_RE = re.compile(r"already exists", re.IGNORECASE)
+_STREAMING_DISABLED_RE = re.compile(
+    r"^(?=.*streaming)(?=.*(?:not enabled|disabled|enable streaming ingestion))",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 def _execute_with_retry(
-    client: KustoClient, database: str, command: str, *, retries: int = _MAX_RETRIES
-) -> object:
-    """Execute a management command with retries for transient network errors."""
+    client: KustoClient,
+    database: str,
+    command: str,
+    *,
+    retries: int = _MAX_RETRIES,
+    on_retry: Callable[[str], None] | None = None,
+) -> KustoResponseDataSet:
+    """Execute a management command, retrying transient errors with exponential backoff.
+
+    Network failures, throttling, and 429/5xx responses are retried (honoring
+    Retry-After when the service sends it); all other errors propagate at once.
+    Each retry notice goes to on_retry if given, else inline on the current line.
+    """
+    from azure.kusto.data.exceptions import KustoNetworkError, KustoServiceError, KustoThrottlingError
+
     last_exc: Exception | None = None
     for attempt in range(1, retries + 1):
         try:
             return client.execute_mgmt(database, command)
-        except KustoServiceError as e:
-            error_msg = str(e)
-            # Retry only on network / metadata errors (transient)
-            if "failed to process network request" in error_msg.lower() or "auth/metadata" in error_msg.lower():
-                last_exc = e
-                if attempt < retries:
-                    print(f"RETRY ({attempt}/{retries}, waiting {_RETRY_DELAY_SECONDS}s)...", end=" ", flush=True)
-                    time.sleep(_RETRY_DELAY_SECONDS)
-                    continue
-            raise  # Non-transient errors propagate immediately
+        except (KustoServiceError, KustoThrottlingError) as e:
+            last_exc = e
+            response = _error_http_response(e)
+            status_code = getattr(response, "status_code", None)
+            transient = (
+                isinstance(e, (KustoNetworkError, KustoThrottlingError))
+                or status_code in _RETRYABLE_STATUS_CODES
+            )
+            if not transient or attempt == retries:
+                raise  # Non-transient errors propagate immediately
+
+            delay = min(_RETRY_MAX_DELAY_SECONDS, _RETRY_BASE_DELAY_SECONDS * 2**attempt)
+            delay += random.uniform(0, 0.25)
+            retry_after = response.headers.get("Retry-After") if response is not None else None
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            notice = f"RETRY ({attempt}/{retries}, waiting {delay:.1f}s)..."
+            if on_retry is not None:
+                on_retry(notice)
+            else:
+                print(notice, end=" ", flush=True)
+            time.sleep(delay)
     raise last_exc  # type: ignore[misc]
 
 
+def _error_http_response(error: Exception) -> object | None:
+    """Return the HTTP response attached to a Kusto error, if any."""
+    from azure.kusto.data.exceptions import KustoThrottlingError
+
+    response = getattr(error, "http_response", None)
+    if response is None and isinstance(error, KustoThrottlingError) and len(error.args) > 1:
+        response = error.args[1]  # KustoThrottlingError(message, response)
+    return response
+
+
 # ---------------------------------------------------------------------------
 # Sub-commands
 # ---------------------------------------------------------------------------
 
 def cmd_setup(args: argparse.Namespace) -> None:
     """Create the full ADX object chain (tables, mappings, policies, MV)."""
+    from azure.kusto.data import KustoClient
+
+    dev = args.profile == "dev"
+    if args.ingest_latency is None:
+        args.ingest_latency = "minimum" if dev else "balanced"
+    commands = _schema_commands(
+        args.ingest_latency, args.age_buckets, streaming_database=args.database if dev else None
+    )
+
+    if dev:
+        print(
+            "WARNING: --profile dev enables streaming ingestion and minimum batching "
+            "thresholds. These raise per-extent overhead — do not use in production."
+        )
+        print()
+
+    if args.dry_run:
+        _dry_run_setup(args, commands)
+        return
+
     kcsb = _build_kcsb(args.cluster, args)
     client = KustoClient(kcsb)
 
     print(f"Setting up ADX schema in {args.database}...")
     print(f"  Cluster: {args.cluster}")
+    print(f"  Ingestion latency profile: {args.ingest_latency}")
     print()
 
-    for i, (description, command) in enumerate(SCHEMA_COMMANDS, start=1):
-        step_label = f"[{i:2d}/{len(SCHEMA_COMMANDS)}]"
+    # Skip commands whose text matches the hash recorded by a previous run
+    applied = {} if args.force else _applied_command_hashes(client, args.database)
+    pending = []
+    for description, command in commands:
+        if applied.get(_command_name(command)) == _command_hash(command):
+            print(f"  SKIPPED (unchanged) {description}")
+        else:
+            pending.append((description, command))
+
+    if not pending:
+        print()
+        print("Setup complete. No schema changes since the last run.")
+        return
+
+    if applied:
+        print()
+
+    if not args.no_script:
+        succeeded = _setup_script(client, args.database, pending)
+    elif args.serial:
+        succeeded = _setup_serial(client, args.database, pending)
+    else:
+        succeeded = _setup_parallel(client, args.database, pending)
+
+    _record_command_hashes(client, args.database, succeeded, create_table=args.force or not applied)
+
+    if len(succeeded) < len(pending):
+        print(f"\nERROR: {len(pending) - len(succeeded)} schema command(s) were not applied.", file=sys.stderr)
+        sys.exit(1)
+
+    print()
+    print("Setup complete. All tables, mappings, policies, and views are ready.")
+
+
+def _dry_run_setup(args: argparse.Namespace, commands: Sequence[tuple[str, str]]) -> None:
+    """Lint and print the schema command plan without contacting the cluster."""
+    print(f"Dry run: schema plan for {args.database} (no network calls)...")
+    print(f"  Ingestion latency profile: {args.ingest_latency}")
+    print()
+
+    label_fmt = _step_label_format(len(commands))
+    invalid = 0
+    for i, (description, command) in enumerate(commands, start=1):
+        error = _lint_schema_command(command)
+        status = "VALID" if error is None else f"INVALID\n         {error}"
+        invalid += error is not None
+        print(f"  {label_fmt.format(i)} {description}... {status}")
+        print(f"         {_command_name(command)}")
+
+    print()
+    if invalid:
+        print(f"ERROR: {invalid} schema command(s) failed validation.", file=sys.stderr)
+        sys.exit(1)
+    print(f"Dry run complete. All {len(commands)} schema commands passed validation.")
+
+
+def _lint_schema_command(command: str) -> str | None:
+    """Return a description of what is wrong with a schema command, or None if it looks valid.
+
+    A lightweight local check (no Kusto parser is available): the command must
+    start with a known control verb, brackets must balance, and a trailing
+    policy or mapping literal must be valid JSON.
+    """
+    if not _CONTROL_COMMAND_RE.match(command):
+        return "not a .create/.alter control command"
+    for opening, closing in ("()", "{}", "[]"):
+        if command.count(opening) != command.count(closing):
+            return f"unbalanced '{opening}{closing}'"
+    literal = _JSON_LITERAL_RE.search(command)
+    if literal:
+        try:
+            json.loads(literal.group(1))
+        except json.JSONDecodeError as e:
+            return f"invalid JSON literal: {e}"
+    return None
+
+
+def _command_name(command: str) -> str:
+    """Return a stable name for a schema command: its text up to the first body token.
+
+    E.g. ".alter table FileTransferEvents_Raw policy ingestionbatching" — the
+    same for every batching profile, so a profile change is seen as a change.
+    """
+    return _COMMAND_NAME_RE.match(command).group(0).strip()
+
+
+def _command_hash(command: str) -> str:
+    """Return the SHA-256 hex digest of a schema command's text."""
+    return hashlib.sha256(command.encode()).hexdigest()
+
+
+def _applied_command_hashes(client: KustoClient, database: str) -> dict[str, str]:
+    """Return {command name: hash} for the latest successfully applied schema commands.
+
+    One query covers every command; returns an empty dict if the metadata table
+    does not exist yet (first run).
+    """
+    from azure.kusto.data.exceptions import KustoServiceError
+
+    query = (
+        f"{_SETUP_META_TABLE}\n"
+        "| summarize arg_max(AppliedUtc, CommandSha256) by CommandName\n"
+        "| project CommandName, CommandSha256"
+    )
+    try:
+        response = client.execute(database, query)
+    except KustoServiceError as e:
+        if e.is_semantic_error():
+            return {}  # Metadata table not created yet
+        raise
+    return {row["CommandName"]: row["CommandSha256"] for row in response.primary_results[0]}
+
+
+def _record_command_hashes(
+    client: KustoClient,
+    database: str,
+    commands: Sequence[tuple[str, str]],
+    *,
+    create_table: bool,
+) -> None:
+    """Record the hashes of successfully applied schema commands in the metadata table."""
+    if not commands:
+        return
+    if create_table:
+        _execute_with_retry(
+            client,
+            database,
+            f".create-merge table {_SETUP_META_TABLE} "
+            "(CommandName: string, CommandSha256: string, AppliedUtc: datetime)",
+        )
+    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    rows = "\n".join(
+        f'"{_command_name(command)}","{_command_hash(command)}",{now}' for _, command in commands
+    )
+    _execute_with_retry(client, database, f".ingest inline into table {_SETUP_META_TABLE} <|\n{rows}")
+
+
+def _schema_commands(
+    ingest_latency: str, age_buckets: bool, streaming_database: str | None = None
+) -> list[tuple[str, str]]:
+    """Return SCHEMA_COMMANDS with the batching policy and DailySummary shape chosen on the CLI.
+
+    With streaming_database set (--profile dev), the streaming ingestion policy
+    commands follow the batching policy step.
+    """
+    overrides = {
+        _command_name(command): (description, command)
+        for description, command in (
+            _batching_policy_command(ingest_latency),
+            _daily_summary_command(age_buckets),
+        )
+    }
+    commands = []
+    for description, command in SCHEMA_COMMANDS:
+        commands.append(overrides.get(_command_name(command), (description, command)))
+        if streaming_database and "policy ingestionbatching" in command:
+            commands.extend(_streaming_policy_commands(streaming_database))
+    return commands
+
+
+def _setup_script(
+    client: KustoClient, database: str, commands: Sequence[tuple[str, str]]
+) -> list[tuple[str, str]]:
+    """Send all schema commands as one database script; return the ones that succeeded."""
+    # Script commands are separated by blank lines, as in the Bicep schema script
+    script = ".execute database script with (ContinueOnErrors=true, ThrowOnErrors=false) <|\n"
+    script += "\n\n".join(command for _, command in commands)
+
+    response = _execute_with_retry(client, database, script)
+
+    # The script returns one row per command, in order; anything unmatched failed
+    rows = list(response.primary_results[0])
+    if len(rows) != len(commands):
+        print(
+            f"  WARNING: Database script returned {len(rows)} result row(s) "
+            f"for {len(commands)} command(s)."
+        )
+
+    label_fmt = _step_label_format(len(commands))
+    succeeded = []
+    for i, (description, command) in enumerate(commands, start=1):
+        step_label = label_fmt.format(i)
+        if i > len(rows):
+            print(f"  {step_label} {description}... FAILED\n         No result returned by the database script")
+            continue
+        result, reason = rows[i - 1]["Result"], rows[i - 1]["Reason"]
+        if result == "Completed":
+            status = "OK"
+        elif _EXISTS_RE.search(str(reason)):
+            status = "SKIPPED (already exists)"
+        else:
+            print(f"  {step_label} {description}... FAILED\n         {reason}")
+            continue
+        succeeded.append((description, command))
+        print(f"  {step_label} {description}... {status}")
+    return succeeded
+
+
+def _setup_serial(
+    client: KustoClient, database: str, commands: Sequence[tuple[str, str]]
+) -> list[tuple[str, str]]:
+    """Run schema commands one at a time, in order; return the ones that succeeded.
+
+    Stops at the first failure, since later steps may depend on it.
+    """
+    from azure.kusto.data.exceptions import KustoServiceError
+
+    label_fmt = _step_label_format(len(commands))
+    succeeded = []
+    for i, (description, command) in enumerate(commands, start=1):
+        step_label = label_fmt.format(i)
         print(f"  {step_label} {description}...", end=" ", flush=True)
         try:
-            _execute_with_retry(client, args.database, command)
-            print("OK")
+            print(_run_schema_command(client, database, command))
         except KustoServiceError as e:
-            # Some commands (e.g., create ifnotexists) may warn but not fail
-            error_msg = str(e)
-            if "already exists" in error_msg.lower():
-                print("SKIPPED (already exists)")
-            else:
-                print(f"FAILED\n         {error_msg}")
-                raise
+            print(f"FAILED\n         {e}")
+            break
+        succeeded.append((description, command))
+    return succeeded
 
-    print()
-    print("Setup complete. All tables, mappings, policies, and views are ready.")
+
+def _setup_parallel(
+    client: KustoClient, database: str, commands: Sequence[tuple[str, str]]
+) -> list[tuple[str, str]]:
+    """Run schema commands concurrently, one dependency phase at a time; return the ones that succeeded.
+
+    A failure lets the rest of its phase finish, then stops before the next phase.
+    """
+    from azure.kusto.data.exceptions import KustoServiceError
+
+    # Commands within a phase are independent — print each progress line
+    # atomically once its command finishes.
+    print_lock = threading.Lock()
+    label_fmt = _step_label_format(len(commands))
+
+    def run_step(step: tuple[int, str, str]) -> bool:
+        i, description, command = step
+        step_label = label_fmt.format(i)
+
+        def report_retry(notice: str) -> None:
+            with print_lock:
+                print(f"  {step_label} {description}... {notice}", flush=True)
+
+        try:
+            status = _run_schema_command(client, database, command, on_retry=report_retry)
+        except KustoServiceError as e:
+            with print_lock:
+                print(f"  {step_label} {description}... FAILED\n         {e}", flush=True)
+            return False
+        with print_lock:
+            print(f"  {step_label} {description}... {status}", flush=True)
+        return True
+
+    succeeded = []
+    with ThreadPoolExecutor(max_workers=_SETUP_MAX_WORKERS) as executor:
+        for phase in _setup_phases(commands):
+            results = list(executor.map(run_step, phase))
+            succeeded += [(description, command) for (_, description, command), ok in zip(phase, results) if ok]
+            if not all(results):
+                break
+    return succeeded
+
+
+def _step_label_format(count: int) -> str:
+    """Return a format string for "[ i/N]" progress labels, padded to the width of N."""
+    return f"[{{:{len(str(count))}d}}/{count}]"
+
+
+def _run_schema_command(
+    client: KustoClient,
+    database: str,
+    command: str,
+    *,
+    on_retry: Callable[[str], None] | None = None,
+) -> str:
+    """Execute a single schema command and return its status text."""
+    from azure.kusto.data.exceptions import KustoServiceError
+
+    try:
+        _execute_with_retry(client, database, command, on_retry=on_retry)
+        return "OK"
+    except KustoServiceError as e:
+        # Some commands (e.g., create ifnotexists) may warn but not fail
+        if _EXISTS_RE.search(str(e)):
+            return "SKIPPED (already exists)"
+        raise
+
+
+def _setup_phase(command: str) -> int:
+    """Return the dependency phase of a schema command (lower phases run first)."""
+    if command.startswith(".create-merge table"):
+        return 0  # Tables — no dependencies
+    if command.startswith(".alter materialized-view"):
+        return 3  # MV policies need the view
+    if "materialized-view" in command or " policy update" in command:
+        return 2  # MV and update policy need the tables and transform function
+    return 1  # Function, mappings, table policies — need only the tables
+
+
+def _setup_phases(commands: Sequence[tuple[str, str]]) -> list[list[tuple[int, str, str]]]:
+    """Group numbered schema commands into dependency phases, preserving step order."""
+    phases: dict[int, list[tuple[int, str, str]]] = {}
+    for i, (description, command) in enumerate(commands, start=1):
+        phases.setdefault(_setup_phase(command), []).append((i, description, command))
+    return [phases[key] for key in sorted(phases)]
 
 
 def cmd_ingest_local(args: argparse.Namespace) -> None:
-    """Ingest a local CSV or JSON file into the staging table via QueuedIngestClient."""
+    """Ingest local CSV or JSON files into the staging table.
+
+    Uses QueuedIngestClient by default. With --streaming, files under 4 MB are
+    sent through streaming ingestion instead (seconds rather than minutes),
+    falling back to queued ingestion if streaming is not enabled. Multiple
+    files (or glob patterns) are ingested concurrently over shared clients.
+    """
+    from azure.kusto.data.data_format import DataFormat
+    from azure.kusto.ingest import IngestionProperties, KustoStreamingIngestClient, QueuedIngestClient
+
     ingest_uri = args.ingest_uri
     if not ingest_uri:
         print("ERROR: --ingest-uri is required for ingestion.", file=sys.stderr)
         sys.exit(1)
 
-    file_path = Path(args.file)
-    if not file_path.exists():
-        print(f"ERROR: File not found: {file_path}", file=sys.stderr)
-        sys.exit(1)
-
-    # Determine format and mapping from file extension
-    data_format, mapping_name = _resolve_format_and_mapping(file_path, args)
+    file_paths = _expand_file_args(args.file)
+
+    # Determine format and mapping for every file up front, before any upload
+    jobs: list[tuple[Path, IngestionProperties]] = []
+    for file_path in file_paths:
+        data_format, mapping_name = _resolve_format_and_mapping(file_path, args)
+        ingestion_props = IngestionProperties(
+            database=args.database,
+            table="FileTransferEvents_Raw",
+            data_format=data_format,
+            ingestion_mapping_reference=mapping_name,
+            ignore_first_record=(data_format == DataFormat.CSV),
+        )
+        jobs.append((file_path, ingestion_props))
 
-    kcsb = _build_kcsb(ingest_uri, args)
-    ingest_client = QueuedIngestClient(kcsb)
+    if args.dry_run:
+        mode = "streaming, queued fallback" if args.streaming else "queued"
+        print(f"Dry run: would ingest {len(jobs)} file(s) into FileTransferEvents_Raw ({mode})...")
+        for file_path, props in jobs:
+            _print_ingestion_plan(file_path.name, props)
+        return
 
-    ingestion_props = IngestionProperties(
-        database=args.database,
-        table="FileTransferEvents_Raw",
-        data_format=data_format,
-        ingestion_mapping_reference=mapping_name,
-        ignore_first_record=(data_format == DataFormat.CSV),
-    )
+    ingest_client = QueuedIngestClient(_build_kcsb(ingest_uri, args))
+    streaming_client = None
+    if args.streaming:
+        # Streaming ingestion goes to the engine (cluster) URI, not the ingest URI
+        streaming_client = KustoStreamingIngestClient(_build_kcsb(args.cluster, args))
 
-    print(f"Ingesting {file_path.name} into FileTransferEvents_Raw...")
-    print(f"  Format: {data_format.name}, Mapping: {mapping_name}")
+    print(f"Ingesting {len(jobs)} file(s) into FileTransferEvents_Raw...")
     print(f"  Ingest URI: {ingest_uri}")
+    if streaming_client is not None:
+        print(f"  Cluster URI: {args.cluster} (streaming)")
+    print()
 
-    file_descriptor = FileDescriptor(str(file_path), file_path.stat().st_size)
-    ingest_client.ingest_from_file(file_descriptor, ingestion_properties=ingestion_props)
+    queued = 0
+    failures = 0
+    with ThreadPoolExecutor(max_workers=_INGEST_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_ingest_local_file, file_path, props, ingest_client, streaming_client): (
+                file_path,
+                props,
+            )
+            for file_path, props in jobs
+        }
+        for future in as_completed(futures):
+            file_path, props = futures[future]
+            label = f"{file_path.name} ({props.format.name}, {props.ingestion_mapping_reference})"
+            try:
+                status = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"  {label}... FAILED\n         {type(e).__name__}: {e}")
+                continue
+            queued += status.startswith("OK (queued")
+            print(f"  {label}... {status}")
 
     print()
-    print(
-        "Ingestion queued successfully. Data flows through the staging table and "
-        "update policy. Allow 1-3 minutes for rows to appear in FileTransferEvents."
-    )
+    if failures:
+        print(f"ERROR: {failures} of {len(jobs)} file(s) failed to ingest.", file=sys.stderr)
+        sys.exit(1)
+    if queued:
+        print(
+            "Ingestion queued successfully. Data flows through the staging table and "
+            "update policy. Allow 1-3 minutes for rows to appear in FileTransferEvents."
+        )
+    else:
+        print(
+            "Ingestion committed via streaming. Data flows through the staging table "
+            "and update policy. Rows appear in FileTransferEvents within seconds."
+        )
+
+
+def _expand_file_args(patterns: list[str]) -> list[Path]:
+    """Expand --file paths and glob patterns into a de-duplicated list of existing files."""
+    file_paths: list[Path] = []
+    seen: set[Path] = set()
+    for pattern in patterns:
+        for match in sorted(glob.glob(pattern)) or [pattern]:
+            file_path = Path(match)
+            if not file_path.is_file():
+                print(f"ERROR: File not found: {file_path}", file=sys.stderr)
+                sys.exit(1)
+            if file_path.resolve() not in seen:
+                seen.add(file_path.resolve())
+                file_paths.append(file_path)
+    return file_paths
+
+
+def _ingest_local_file(
+    file_path: Path,
+    ingestion_props: IngestionProperties,
+    ingest_client: QueuedIngestClient,
+    streaming_client: KustoStreamingIngestClient | None,
+) -> str:
+    """Ingest one local file, streaming it when possible, and return its status text."""
+    from azure.kusto.ingest import FileDescriptor
+
+    if file_path.suffix.lower() in _COMPRESSED_SUFFIXES:
+        # Already compressed: upload as is, and let the SDK estimate the
+        # uncompressed size. Streaming would send the compressed bytes as text.
+        file_descriptor = FileDescriptor(str(file_path), source_id=uuid.uuid4())
+        ingest_client.ingest_from_file(file_descriptor, ingestion_properties=ingestion_props)
+        note = "; compressed input is not streamed" if streaming_client is not None else ""
+        return f"OK (queued{note})"
+
+    file_size = file_path.stat().st_size
+    note = ""
+    if streaming_client is not None:
+        if file_size >= _STREAMING_MAX_BYTES:
+            note = "; over the 4 MB streaming limit"
+        elif _ingest_streaming(streaming_client, file_path, ingestion_props):
+            return "OK (streamed)"
+        else:
+            note = "; streaming ingestion is not enabled"
+
+    # Upload a fast gzip of the file; the SDK would otherwise compress it in
+    # memory at the slowest level. The size hint stays the uncompressed size.
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        gz_path = _gzip_file(file_path, Path(tmp_dir))
+        file_descriptor = FileDescriptor(str(gz_path), file_size, source_id=uuid.uuid4())
+        ingest_client.ingest_from_file(file_descriptor, ingestion_properties=ingestion_props)
+    return f"OK (queued{note})"
+
+
+def _gzip_file(file_path: Path, out_dir: Path) -> Path:
+    """Gzip a file into out_dir at compression level 1 and return the .gz path."""
+    gz_path = out_dir / f"{file_path.name}.gz"
+    with open(file_path, "rb") as src, gzip.open(gz_path, "wb", compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+    return gz_path
+
+
+def _ingest_streaming(
+    streaming_client: KustoStreamingIngestClient,
+    file_path: Path,
+    ingestion_props: IngestionProperties,
+) -> bool:
+    """Stream a small file to the engine endpoint; return False if streaming is not enabled."""
+    from azure.kusto.data.exceptions import KustoServiceError
+    from azure.kusto.ingest import StreamDescriptor
+
+    data = file_path.read_bytes()
+    if ingestion_props.ignore_first_record:
+        # Streaming ingestion ignores ignore_first_record — drop the CSV header here
+        data = data.split(b"\n", 1)[1] if b"\n" in data else b""
+
+    try:
+        streaming_client.ingest_from_stream(
+            StreamDescriptor(io.BytesIO(data)), ingestion_properties=ingestion_props
+        )
+    except KustoServiceError as e:
+        # A cluster without streaming ingestion has no endpoint for it (404)
+        status_code = getattr(_error_http_response(e), "status_code", None)
+        if status_code == 404 or _STREAMING_DISABLED_RE.search(str(e)):
+            return False
+        raise
+    return True
 
 
 def cmd_ingest_blob(args: argparse.Namespace) -> None:
     """Ingest a blob from Azure Storage into the staging table via QueuedIngestClient."""
+    from azure.kusto.data.data_format import DataFormat
+    from azure.kusto.ingest import BlobDescriptor, IngestionProperties, QueuedIngestClient
+
     ingest_uri = args.ingest_uri
     if not ingest_uri:
         print("ERROR: --ingest-uri is required for ingestion.", file=sys.stderr)
@@ -370,9 +1016,6 @@ def cmd_ingest_blob(args: argparse.Namespace) -> None:
     # Determine format from blob URI extension
     data_format, mapping_name = _resolve_format_and_mapping_from_uri(blob_uri, args)
 
-    kcsb = _build_kcsb(ingest_uri, args)
-    ingest_client = QueuedIngestClient(kcsb)
-
     ingestion_props = IngestionProperties(
         database=args.database,
         table="FileTransferEvents_Raw",
@@ -381,12 +1024,29 @@ def cmd_ingest_blob(args: argparse.Namespace) -> None:
         ignore_first_record=(data_format == DataFormat.CSV),
     )
 
+    if args.dry_run:
+        print("Dry run: would ingest 1 blob into FileTransferEvents_Raw (queued)...")
+        _print_ingestion_plan(blob_uri.split("?")[0], ingestion_props)
+        return
+
+    kcsb = _build_kcsb(ingest_uri, args)
+    ingest_client = QueuedIngestClient(kcsb)
+
     print(f"Ingesting blob into FileTransferEvents_Raw...")
     print(f"  Blob: {blob_uri}")
     print(f"  Format: {data_format.name}, Mapping: {mapping_name}")
 
-    blob_descriptor = BlobDescriptor(blob_uri)
-    ingest_client.ingest_from_blob(blob_descriptor, ingestion_properties=ingestion_props)
+    # The size hint is the raw (uncompressed) size; a compressed blob's length
+    # would understate it, so leave those to the service's estimate.
+    blob_size = None
+    if not blob_uri.split("?")[0].lower().endswith(_COMPRESSED_SUFFIXES):
+        blob_size = _blob_size(blob_uri, args)
+    if blob_size is not None:
+        print(f"  Size: {blob_size:,} bytes")
+
+    blob_descriptor = BlobDescriptor(blob_uri, size=blob_size, source_id=uuid.uuid4())
+    result = ingest_client.ingest_from_blob(blob_descriptor, ingestion_properties=ingestion_props)
+    print(f"  Source ID: {result.source_id}")
 
     print()
     print(
@@ -395,8 +1055,50 @@ def cmd_ingest_blob(args: argparse.Namespace) -> None:
     )
 
 
+def _blob_size(blob_uri: str, args: argparse.Namespace) -> int | None:
+    """HEAD the blob for its size hint; return None if the blob cannot be read.
+
+    A SAS URL is read anonymously; otherwise the run's token credential is used,
+    which needs Storage Blob Data Reader on the account. Without a size the
+    Data Management service probes the blob itself before dispatching it.
+    """
+    credential = None
+    if "?" not in blob_uri:
+        credential = _get_credential(
+            args.auth_method,
+            args.client_id or os.environ.get("AZURE_CLIENT_ID"),
+            args.client_secret or os.environ.get("AZURE_CLIENT_SECRET"),
+            args.tenant_id or os.environ.get("AZURE_TENANT_ID"),
+        )
+    try:
+        from azure.storage.blob import BlobClient
+
+        with BlobClient.from_blob_url(blob_uri, credential=credential) as blob_client:
+            return blob_client.get_blob_properties().size
+    except Exception as e:
+        print(f"  WARNING: Could not read blob size ({type(e).__name__}); sending no size hint.")
+        return None
+
+
+def _print_ingestion_plan(source: str, props: IngestionProperties) -> None:
+    """Print the IngestionProperties a dry run would submit for one source."""
+    print(f"  {source}")
+    print(
+        f"    database={props.database}, table={props.table}, format={props.format.name}, "
+        f"mapping={props.ingestion_mapping_reference}, ignore_first_record={props.ignore_first_record}"
+    )
+
+
 def cmd_verify(args: argparse.Namespace) -> None:
     """Query FileTransferEvents and display the latest rows to confirm ingestion."""
+    from azure.kusto.data import KustoClient
+
+    if args.dry_run:
+        print(f"Dry run: would run against {args.database} (no network calls):")
+        print()
+        print(VERIFY_QUERY)
+        return
+
     kcsb = _build_kcsb(args.cluster, args)
     client = KustoClient(kcsb)
 
@@ -404,49 +1106,36 @@ def cmd_verify(args: argparse.Namespace) -> None:
     print()
 
     response = client.execute(args.database, VERIFY_QUERY)
+    result, summary = response.primary_results[0], response.primary_results[1]
 
-    # Get column names
-    columns = [col.column_name for col in response.primary_results[0].columns]
-
-    # Collect rows
-    rows = list(response.primary_results[0])
+    # Buffer the pre-formatted rows; the null/status checks come from the summary
+    header = _SEP.join(col.rjust(_COL_W) for col in _VERIFY_COLUMNS)
+    lines = [f"  {header}\n", f"  {'-' * len(header)}\n"]
+    lines.extend(f"  {row[0]}\n" for row in result)
+    row_count = len(lines) - 2
 
-    if not rows:
+    if not row_count:
         print("  No rows found in FileTransferEvents.")
         print("  If you recently ingested data, wait 1-3 minutes and try again.")
         return
 
-    print(f"  Found {len(rows)} recent rows (showing up to 20):")
-    print()
-
-    # Print header
-    header = " | ".join(f"{col:>20s}" for col in columns)
-    print(f"  {header}")
-    print(f"  {'-' * len(header)}")
-
-    # Print rows
-    for row in rows:
-        values = []
-        for col in columns:
-            val = row[col]
-            values.append(f"{str(val):>20s}")
-        print(f"  {' | '.join(values)}")
+    # One write for the whole table instead of one per row
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
 
     print()
+    print(f"  Found {row_count} recent rows (showing up to 20).")
+
+    summary_row = summary[0]
+    null_timestamps = summary_row["NullTimestamps"] or 0
+    status_counts = summary_row["ByStatus"] or {}
 
     # Validate Timestamp is never null
-    null_timestamps = sum(1 for row in rows if row["Timestamp"] is None)
     if null_timestamps > 0:
         print(f"  WARNING: {null_timestamps} row(s) have null Timestamp!")
     else:
         print("  All rows have non-null Timestamp. Schema verification PASSED.")
 
-    # Count by status
-    status_counts: dict[str, int] = {}
-    for row in rows:
-        status = str(row["Status"])
-        status_counts[status] = status_counts.get(status, 0) + 1
-
     print(f"  Status distribution: {status_counts}")
 
 
@@ -458,6 +1147,8 @@ def _resolve_format_and_mapping(
     file_path: Path, args: argparse.Namespace
 ) -> tuple[DataFormat, str]:
     """Determine ingestion format and mapping name from file extension or args."""
+    from azure.kusto.data.data_format import DataFormat
+
     fmt = getattr(args, "format", None)
     mapping = getattr(args, "mapping", None)
 
@@ -465,11 +1156,10 @@ def _resolve_format_and_mapping(
         fmt_lower = fmt.lower()
     else:
         ext = file_path.suffix.lower()
-        if ext == ".csv":
-            fmt_lower = "csv"
-        elif ext in (".json", ".jsonl"):
-            fmt_lower = "json"
-        else:
+        if ext in _COMPRESSED_SUFFIXES:
+            ext = Path(file_path.stem).suffix.lower()  # events.csv.gz -> .csv
+        fmt_lower = _EXT_TO_FMT.get(ext[1:])
+        if fmt_lower is None:
             print(
                 f"ERROR: Cannot determine format from extension '{ext}'. "
                 "Use --format csv or --format json.",
@@ -494,6 +1184,8 @@ def _resolve_format_and_mapping_from_uri(
     uri: str, args: argparse.Namespace
 ) -> tuple[DataFormat, str]:
     """Determine format from a blob URI or explicit args."""
+    from azure.kusto.data.data_format import DataFormat
+
     fmt = getattr(args, "format", None)
     mapping = getattr(args, "mapping", None)
 
@@ -502,11 +1194,11 @@ def _resolve_format_and_mapping_from_uri(
     else:
         # Extract extension from URI (strip query params)
         path_part = uri.split("?")[0]
-        if path_part.endswith(".csv"):
-            fmt_lower = "csv"
-        elif path_part.endswith(".json") or path_part.endswith(".jsonl"):
-            fmt_lower = "json"
-        else:
+        stem, _, ext = path_part.rpartition(".")
+        if f".{ext.lower()}" in _COMPRESSED_SUFFIXES:
+            ext = stem.rpartition(".")[-1]  # events.csv.gz -> csv
+        fmt_lower = _EXT_TO_FMT.get(ext.lower())
+        if fmt_lower is None:
             print(
                 "ERROR: Cannot determine format from blob URI. "
                 "Use --format csv or --format json.",
@@ -555,6 +1247,14 @@ def build_parser() -> argparse.ArgumentParser:
     shared.add_argument("--client-id", help="Service principal client ID")
     shared.add_argument("--client-secret", help="Service principal client secret")
     shared.add_argument("--tenant-id", help="Azure AD tenant ID")
+    shared.add_argument(
+        "--dry-run",
+        action="store_true",
+        help=(
+            "Validate and print what would be executed or submitted without any network "
+            "calls (schema lint for setup, ingestion properties for ingest commands)"
+        ),
+    )
 
     parser = argparse.ArgumentParser(
         prog="adx_runbook",
@@ -606,6 +1306,53 @@ Auth methods:
         parents=[shared],
         help="Create the full ADX object chain (tables, mappings, policies, materialized view)",
     )
+    setup_parser.add_argument(
+        "--profile",
+        choices=["default", "dev"],
+        default="default",
+        help=(
+            "dev: also enable streaming ingestion on the database and staging table, and "
+            "default --ingest-latency to minimum, so rows land in seconds (not for production)"
+        ),
+    )
+    setup_parser.add_argument(
+        "--ingest-latency",
+        choices=list(_BATCHING_PROFILES),
+        help=(
+            "Staging-table ingestion batching profile: minimum (10 s / 1 item, --profile dev "
+            "default), low (10 s), balanced (1 min, default), or throughput (5 min, for bulk loads)"
+        ),
+    )
+    setup_parser.add_argument(
+        "--age-buckets",
+        action="store_true",
+        help=(
+            "Create DailySummary with fixed age-bucket counters (<=5/30/120 min) instead of "
+            "the AgeDigest tdigest; cheaper view refresh, but the P95 age panels need AgeDigest. "
+            "Only applies when the view does not exist yet"
+        ),
+    )
+    setup_parser.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            f"Run every schema command, even those whose hash in {_SETUP_META_TABLE} "
+            "shows them unchanged since the last run"
+        ),
+    )
+    setup_parser.add_argument(
+        "--no-script",
+        action="store_true",
+        help=(
+            "Send each schema command as its own request instead of one database script "
+            "(useful for debugging a failing command)"
+        ),
+    )
+    setup_parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="With --no-script, run commands one at a time instead of in parallel dependency phases",
+    )
 
     # ingest-local
     ingest_local_parser = subparsers.add_parser(
@@ -621,7 +1368,11 @@ Auth methods:
     ingest_local_parser.add_argument(
         "--file",
         required=True,
-        help="Path to the local CSV or JSON file",
+        nargs="+",
+        help=(
+            "Path(s) or glob pattern(s) of local CSV or JSON files; "
+            "multiple files are ingested concurrently"
+        ),
     )
     ingest_local_parser.add_argument(
         "--format",
@@ -632,6 +1383,14 @@ Auth methods:
         "--mapping",
         help="Ingestion mapping name (defaults based on format)",
     )
+    ingest_local_parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help=(
+            "Use streaming ingestion for files under 4 MB (rows land in seconds); "
+            "falls back to queued ingestion if streaming is not enabled"
+        ),
+    )
 
     # ingest-blob
     ingest_blob_parser = subparsers.add_parser(
@@ -693,6 +1452,8 @@ def main() -> None:
         parser.print_help()
         sys.exit(1)
 
+    from azure.kusto.data.exceptions import KustoServiceError
+
     try:
         handler(args)
     except KustoServiceError as e: